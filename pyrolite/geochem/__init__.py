@@ -8,27 +8,217 @@ from ..util import units
 from ..util.log import Handle
 from ..util.meta import update_docstring_references
 from . import norm, parse, transform
-from .ind import REE, REY, _common_elements, _common_oxides
+from .ind import REE, REY, _REE, _REY, _common_elements, _common_oxides
 from .ions import set_default_ionic_charges
 
 logger = Handle(__name__)
 
 set_default_ionic_charges()
 
+# reference vocabulary used to classify columns, built once on import; each entry
+# has a set of bit flags indicating the categories it belongs to
+_ELEMENT, _OXIDE, _REE_FLAG, _REY_FLAG = 1, 2, 4, 8
+_vocabulary = pd.Index(sorted(_common_elements | _common_oxides))
+_vocabulary_flags = (
+    _vocabulary.isin(_common_elements) * _ELEMENT
+    | _vocabulary.isin(_common_oxides) * _OXIDE
+    | _vocabulary.isin(REE()) * _REE_FLAG
+    | _vocabulary.isin(REY()) * _REY_FLAG
+)
+# REE and REY indexes ordered by atomic number
+_REE_index = pd.Index(REE())
+_REY_index = pd.Index(REY())
+
+
+def _float_dtype(df):
+    """
+    Get the floating point dtype shared by all columns of a dataframe, if there is
+    one.
+
+    Parameters
+    -----------
+    df : :class:`pandas.DataFrame`
+        Dataframe to check.
+
+    Returns
+    --------
+    :class:`numpy.dtype` | :code:`None`
+    """
+    dtypes = set(df.dtypes)
+    if len(dtypes) == 1:
+        dtype = dtypes.pop()
+        if isinstance(dtype, np.dtype) and np.issubdtype(dtype, np.floating):
+            return dtype
+    return None
+
+
+def _match_float_dtype(arr, df):
+    """
+    Cast an array of reference values to the dtype of a dataframe where all of its
+    columns share a single floating point dtype, such that arithmetic with the
+    reference values doesn't upcast the data (e.g. :code:`float32` data).
+
+    Parameters
+    -----------
+    arr : :class:`numpy.ndarray` | :class:`float`
+        Reference values.
+    df : :class:`pandas.DataFrame`
+        Dataframe the values are to be used with.
+
+    Returns
+    --------
+    :class:`numpy.ndarray`
+    """
+    return np.asarray(arr, dtype=_float_dtype(df))
+
 
-# note that only some of these methods will be valid for series
-@pd.api.extensions.register_series_accessor("pyrochem")
 @pd.api.extensions.register_dataframe_accessor("pyrochem")
 class pyrochem(object):
     def __init__(self, obj):
         """Custom dataframe accessor for pyrolite geochemistry."""
         self._validate(obj)
         self._obj = obj
+        self._column_cache = {}
 
     @staticmethod
     def _validate(obj):
         pass
 
+    def _from_column_cache(self, key, func):
+        """
+        Get a value derived from the column index, cached against the current
+        column index.
+
+        Parameters
+        -----------
+        key : :class:`str`
+            Name under which to cache the value.
+        func : :class:`callable`
+            Function which takes the column index and returns the value.
+
+        Notes
+        ------
+        Pandas replaces the column index when columns are added, removed or renamed,
+        so a cached value is only reused while the index it was derived from is
+        still in place.
+        """
+        columns = self._obj.columns
+        cached = self._column_cache.get(key)
+        if cached is None or cached[0] is not columns:
+            cached = (columns, func(columns))
+            self._column_cache[key] = cached
+        return cached[1]
+
+    def _cached_columns(self, key, select):
+        """
+        Get a list of columns from a selection function, cached against the current
+        column index.
+
+        Parameters
+        -----------
+        key : :class:`str`
+            Name under which to cache the selection.
+        select : :class:`callable`
+            Function which takes the column index and returns a list of columns.
+
+        Returns
+        --------
+        :class:`list`
+        """
+        return list(self._from_column_cache(key, lambda cols: tuple(select(cols))))
+
+    @property
+    def _column_flags(self):
+        """
+        Classify the columns as elements, oxides, REE and REY in a single pass over
+        the column index.
+
+        Returns
+        --------
+        :class:`numpy.ndarray`
+            Array of bit flags for each column.
+        """
+
+        def classify(cols):
+            positions = _vocabulary.get_indexer(cols)
+            flags = np.where(positions >= 0, _vocabulary_flags[positions], 0)
+            flags.flags.writeable = False
+            return flags
+
+        return self._from_column_cache("flags", classify)
+
+    @property
+    def _REE_positions(self):
+        """
+        Get the integer positions of the REE columns, ordered by atomic number.
+
+        Returns
+        --------
+        :class:`numpy.ndarray`
+        """
+
+        def locate(cols):
+            positions = cols.get_indexer_for(self.list_REE)
+            positions.flags.writeable = False
+            return positions
+
+        return self._from_column_cache("REE_positions", locate)
+
+    def _select_flagged(self, flag):
+        """Get the columns which have a specific category flag."""
+        return self._obj.columns[(self._column_flags & flag) > 0]
+
+    def _set_columns(self, columns, values):
+        """
+        Assign values to a subset of columns.
+
+        Parameters
+        -----------
+        columns : :class:`list`
+            Columns to assign values to.
+        values : :class:`pandas.DataFrame` | :class:`numpy.ndarray`
+            Values to assign.
+
+        Notes
+        ------
+        Columns are matched by position. Dataframes with a single dtype which share
+        the index of the target (e.g. those derived from the getters) are assigned
+        as arrays, skipping index alignment.
+        """
+        if (
+            isinstance(values, pd.DataFrame)
+            and values.index.equals(self._obj.index)
+            and values.dtypes.nunique() == 1
+        ):
+            values = values.values
+        self._obj[columns] = values
+
+    def _update_inplace(self, df):
+        """
+        Update the source dataframe to match a transformed version of itself.
+
+        Parameters
+        -----------
+        df : :class:`pandas.DataFrame`
+            Transformed dataframe.
+
+        Returns
+        --------
+        :class:`pandas.DataFrame`
+            The updated source dataframe.
+
+        Notes
+        ------
+        Columns absent from the transformed dataframe are dropped, and new columns
+        are appended. This is intended for transformations which retain the column
+        ordering of the source dataframe.
+        """
+        drop = self._obj.columns[~self._obj.columns.isin(df.columns)]
+        if drop.size:
+            self._obj.drop(columns=drop, inplace=True)
+        self._set_columns(df.columns.tolist(), df)
+        return self._obj
+
     # pyrolite.geochem.ind functions
 
     @property
@@ -44,8 +234,9 @@ class pyrochem(object):
         -------
         The list will have the same ordering as the source DataFrame.
         """
-        fltr = self._obj.columns.isin(_common_elements)
-        return self._obj.columns[fltr].tolist()
+        return self._cached_columns(
+            "elements", lambda cols: self._select_flagged(_ELEMENT).tolist()
+        )
 
     @property
     def list_isotope_ratios(self):
@@ -60,8 +251,10 @@ class pyrochem(object):
         -------
         The list will have the same ordering as the source DataFrame.
         """
-        fltr = [parse.is_isotoperatio(c) for c in self._obj.columns]
-        return self._obj.columns[fltr].tolist()
+        return self._cached_columns(
+            "isotope_ratios",
+            lambda cols: cols[[parse.is_isotoperatio(c) for c in cols]].tolist(),
+        )
 
     @property
     def list_REE(self):
@@ -76,7 +269,12 @@ class pyrochem(object):
         -------
         The returned list will reorder REE based on atomic number.
         """
-        return [i for i in REE() if i in self._obj.columns]
+
+        def select(cols):
+            present = self._select_flagged(_REE_FLAG)
+            return _REE_index[_REE_index.isin(present)].tolist()
+
+        return self._cached_columns("REE", select)
 
     @property
     def list_REY(self):
@@ -91,7 +289,12 @@ class pyrochem(object):
         -------
         The returned list will reorder REE based on atomic number.
         """
-        return [i for i in REY() if i in self._obj.columns]
+
+        def select(cols):
+            present = self._select_flagged(_REY_FLAG)
+            return _REY_index[_REY_index.isin(present)].tolist()
+
+        return self._cached_columns("REY", select)
 
     @property
     def list_oxides(self):
@@ -106,13 +309,65 @@ class pyrochem(object):
         -------
         The list will have the same ordering as the source DataFrame.
         """
-        fltr = self._obj.columns.isin(_common_oxides)
-        return self._obj.columns[fltr].tolist()
+        return self._cached_columns(
+            "oxides", lambda cols: self._select_flagged(_OXIDE).tolist()
+        )
 
     @property
     def list_compositional(self):
         return list(self.list_oxides + self.list_elements)
 
+    @property
+    def element_set(self):
+        """
+        Get the set of element names which columns are checked against.
+
+        Returns
+        --------
+        :class:`frozenset`
+
+        Notes
+        -------
+        This is useful for fast membership checks, e.g. :code:`c in
+        df.pyrochem.element_set`. To get the element columns themselves, use
+        :attr:`list_elements`.
+        """
+        return _common_elements
+
+    @property
+    def oxide_set(self):
+        """
+        Get the set of oxide names which columns are checked against.
+
+        Returns
+        --------
+        :class:`frozenset`
+        """
+        return _common_oxides
+
+    @property
+    def REE_set(self):
+        """
+        Get the set of Rare Earth Element names which columns are checked against.
+
+        Returns
+        --------
+        :class:`frozenset`
+        """
+        return _REE
+
+    @property
+    def REY_set(self):
+        """
+        Get the set of Rare Earth Element and Yttrium names which columns are
+        checked against.
+
+        Returns
+        --------
+        :class:`frozenset`
+        """
+        return _REY
+
     @property
     def elements(self):
         """
@@ -126,7 +381,7 @@ class pyrochem(object):
 
     @elements.setter
     def elements(self, df):
-        self._obj[self.list_elements] = df
+        self._set_columns(self.list_elements, df)
 
     @property
     def REE(self):
@@ -137,11 +392,11 @@ class pyrochem(object):
         --------
         :class:`pandas.Dataframe`
         """
-        return self._obj[self.list_REE]
+        return self._obj.take(self._REE_positions, axis=1)
 
     @REE.setter
     def REE(self, df):
-        self._obj[self.list_REE] = df
+        self._set_columns(self.list_REE, df)
 
     @property
     def REY(self):
@@ -156,7 +411,7 @@ class pyrochem(object):
 
     @REY.setter
     def REY(self, df):
-        self._obj[self.list_REY] = df
+        self._set_columns(self.list_REY, df)
 
     @property
     def oxides(self):
@@ -167,11 +422,11 @@ class pyrochem(object):
         --------
         :class:`pandas.Dataframe`
         """
-        return self._obj.loc[:, self.list_oxides]
+        return self._obj[self.list_oxides]
 
     @oxides.setter
     def oxides(self, df):
-        self._obj[self.list_oxides] = df
+        self._set_columns(self.list_oxides, df)
 
     @property
     def isotope_ratios(self):
@@ -186,7 +441,7 @@ class pyrochem(object):
 
     @isotope_ratios.setter
     def isotope_ratios(self, df):
-        self._obj[self.list_isotope_ratios] = df
+        self._set_columns(self.list_isotope_ratios, df)
 
     @property
     def compositional(self):
@@ -201,11 +456,11 @@ class pyrochem(object):
         ------
         This wil not include isotope ratios.
         """
-        return self._obj.loc[:, self.list_compositional]
+        return self._obj[self.list_compositional]
 
     @compositional.setter
     def compositional(self, df):
-        self._obj[self.list_compositional] = df
+        self._set_columns(self.list_compositional, df)
 
     # pyrolite.geochem.parse functions
 
@@ -237,7 +492,7 @@ class pyrochem(object):
 
     # pyrolite.geochem.transform functions
 
-    def to_molecular(self, renorm=True):
+    def to_molecular(self, renorm=True, inplace=False):
         """
         Converts mass quantities to molar quantities.
 
@@ -245,6 +500,9 @@ class pyrochem(object):
         -----------
         renorm : :class:`bool`, :code:`True`
             Whether to renormalise the dataframe after converting to relative moles.
+        inplace : :class:`bool`, :code:`False`
+            Whether to update the source dataframe in place, rather than returning a
+            transformed copy.
 
         Notes
         ------
@@ -255,9 +513,10 @@ class pyrochem(object):
         :class:`pandas.DataFrame`
             Transformed dataframe.
         """
-        return transform.to_molecular(self._obj, renorm=renorm)
+        out = transform.to_molecular(self._obj, renorm=renorm)
+        return self._update_inplace(out) if inplace else out
 
-    def to_weight(self, renorm=True):
+    def to_weight(self, renorm=True, inplace=False):
         """
         Converts molar quantities to mass quantities.
 
@@ -265,6 +524,9 @@ class pyrochem(object):
         -----------
         renorm : :class:`bool`, :code:`True`
             Whether to renormalise the dataframe after converting to relative moles.
+        inplace : :class:`bool`, :code:`False`
+            Whether to update the source dataframe in place, rather than returning a
+            transformed copy.
 
         Notes
         ------
@@ -275,10 +537,14 @@ class pyrochem(object):
         :class:`pandas.DataFrame`
             Transformed dataframe.
         """
-        return transform.to_weight(self._obj, renorm=renorm)
+        out = transform.to_weight(self._obj, renorm=renorm)
+        return self._update_inplace(out) if inplace else out
 
     def devolatilise(
-        self, exclude=["H2O", "H2O_PLUS", "H2O_MINUS", "CO2", "LOI"], renorm=True
+        self,
+        exclude=["H2O", "H2O_PLUS", "H2O_MINUS", "CO2", "LOI"],
+        renorm=True,
+        inplace=False,
     ):
         """
         Recalculates components after exclusion of volatile phases (e.g. H2O, CO2).
@@ -289,13 +555,17 @@ class pyrochem(object):
             Components to exclude from the dataset.
         renorm : :class:`bool`, :code:`True`
             Whether to renormalise the dataframe after devolatilisation.
+        inplace : :class:`bool`, :code:`False`
+            Whether to update the source dataframe in place, rather than returning a
+            transformed copy.
 
         Returns
         -------
         :class:`pandas.DataFrame`
             Transformed dataframe.
         """
-        return transform.devolatilise(self._obj, exclude=exclude, renorm=renorm)
+        out = transform.devolatilise(self._obj, exclude=exclude, renorm=renorm)
+        return self._update_inplace(out) if inplace else out
 
     def elemental_sum(
         self, component=None, to=None, total_suffix="T", logdata=False, molecular=False
@@ -330,7 +600,13 @@ class pyrochem(object):
         )
 
     def aggregate_element(
-        self, to, total_suffix="T", logdata=False, renorm=False, molecular=False
+        self,
+        to,
+        total_suffix="T",
+        logdata=False,
+        renorm=False,
+        molecular=False,
+        inplace=False,
     ):
         """
         Aggregates cation information from oxide and elemental components to either a
@@ -353,6 +629,9 @@ class pyrochem(object):
             Whether the data has been log transformed.
         molecular : :class:`bool`, :code:`False`
             Whether to perform a sum of molecular data.
+        inplace : :class:`bool`, :code:`False`
+            Whether to update the source dataframe in place, rather than returning a
+            transformed copy.
 
         Notes
         -------
@@ -363,7 +642,7 @@ class pyrochem(object):
         :class:`pandas.Series`
             Series with cation aggregated.
         """
-        return transform.aggregate_element(
+        out = transform.aggregate_element(
             self._obj,
             to,
             total_suffix=total_suffix,
@@ -371,6 +650,7 @@ class pyrochem(object):
             renorm=renorm,
             molecular=molecular,
         )
+        return self._update_inplace(out) if inplace else out
 
     def recalculate_Fe(
         self, to="FeOT", renorm=False, total_suffix="T", logdata=False, molecular=False
@@ -603,6 +883,42 @@ class pyrochem(object):
 
     # pyrolite.geochem.norm functions
 
+    @staticmethod
+    def _reference_abundances(reference, cols, units=None, convert_first=False):
+        """
+        Get the abundances of a reference composition for a set of columns.
+
+        Parameters
+        ----------
+        reference : :class:`str` | :class:`~pyrolite.geochem.norm.Composition` | :class:`numpy.ndarray`
+            Reference composition, or an array of abundances ordered as `cols`.
+        cols : :class:`list`
+            Columns to get reference abundances for.
+        units : :class:`str`, :code:`None`
+            Units of the reference composition to use.
+        convert_first : :class:`bool`, :code:`False`
+            Whether to convert the reference composition to match the columns
+            before getting the abundances.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+        """
+        if isinstance(reference, str):
+            if not convert_first:
+                return norm._reference_abundances(reference, units, tuple(cols))
+            reference = norm.get_reference_composition(reference)
+        if isinstance(reference, norm.Composition):
+            if units is not None:
+                reference.set_units(units)
+            if convert_first:
+                reference.comp = transform.convert_chemistry(reference.comp, cols)
+            return reference[cols]
+        # list, iterable, pd.Index etc
+        norm_abund = np.asarray(reference, dtype=float)
+        assert len(norm_abund) == len(cols)
+        return norm_abund
+
     def normalize_to(self, reference=None, units=None, convert_first=False):
         """
         Normalise a dataframe to a given reference composition.
@@ -627,23 +943,13 @@ class pyrochem(object):
         -----
         This assumes that dataframes have a single set of units.
         """
-
-        if isinstance(reference, (str, norm.Composition)):
-            if not isinstance(reference, norm.Composition):
-                N = norm.get_reference_composition(reference)
-            else:
-                N = reference
-            if units is not None:
-                N.set_units(units)
-            if convert_first:
-                N.comp = transform.convert_chemistry(N.comp, self.list_compositional)
-            norm_abund = N[self.list_compositional]
-        else:  # list, iterable, pd.Index etc
-            norm_abund = np.array(reference)
-            assert len(norm_abund) == len(self.list_compositional)
-
+        cols = self.list_compositional
+        norm_abund = self._reference_abundances(
+            reference, cols, units=units, convert_first=convert_first
+        )
         # this list should have the same ordering as the input dataframe
-        return self._obj[self.list_compositional].div(norm_abund)
+        comp = self._obj[cols]
+        return comp.div(_match_float_dtype(norm_abund, comp), axis=1)
 
     def denormalize_from(self, reference=None, units=None):
         """
@@ -665,21 +971,12 @@ class pyrochem(object):
         -----
         This assumes that dataframes have a single set of units.
         """
-
-        if isinstance(reference, (str, norm.Composition)):
-            if not isinstance(reference, norm.Composition):
-                N = norm.get_reference_composition(reference)
-            else:
-                N = reference
-            if units is not None:
-                N.set_units(units)
-            N.comp = transform.convert_chemistry(N.comp, self.list_compositional)
-            norm_abund = N[self.list_compositional]
-        else:  # list, iterable, pd.Index etc
-            norm_abund = np.array(reference)
-            assert len(norm_abund) == len(self.list_compositional)
-
-        return self._obj[self.list_compositional] * norm_abund
+        cols = self.list_compositional
+        norm_abund = self._reference_abundances(
+            reference, cols, units=units, convert_first=True
+        )
+        comp = self._obj[cols]
+        return comp.mul(_match_float_dtype(norm_abund, comp), axis=1)
 
     def scale(self, in_unit, target_unit="ppm"):
         """
@@ -697,9 +994,43 @@ class pyrochem(object):
         :class:`pandas.DataFrame`
             Dataframe with new scale.
         """
-        return self._obj * units.scale(in_unit, target_unit)
+        factor = units.scale(in_unit, target_unit)
+        dtype = _float_dtype(self._obj)
+        if dtype is not None:  # scale homogeneous float data as a single array
+            return pd.DataFrame(
+                np.multiply(self._obj.values, factor, dtype=dtype),
+                index=self._obj.index,
+                columns=self._obj.columns,
+            ).__finalize__(self._obj)  # keep attrs, e.g. from pyrocomp transforms
+        return self._obj * factor
 
 
 pyrochem.lambda_lnREE = update_docstring_references(
     pyrochem.lambda_lnREE, ref="localref"
 )
+
+
+# series only support a subset of the methods which don't depend on columns
+@pd.api.extensions.register_series_accessor("pyrochem")
+class _pyrochem_series(object):
+    def __init__(self, obj):
+        """Custom series accessor for pyrolite geochemistry."""
+        self._obj = obj
+
+    def scale(self, in_unit, target_unit="ppm"):
+        """
+        Scale a series from one set of units to another.
+
+        Parameters
+        ----------
+        in_unit : :class:`str`
+            Units to be converted from
+        target_unit : :class:`str`, :code:`"ppm"`
+            Units to scale to.
+
+        Returns
+        -------
+        :class:`pandas.Series`
+            Series with new scale.
+        """
+        return self._obj * units.scale(in_unit, target_unit)
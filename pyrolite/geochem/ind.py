@@ -6,6 +6,7 @@ Todo
 ------
 * Incompatibility indexes for spider plot ordering.
 """
+import functools
 import re
 
 import numpy as np
@@ -73,7 +74,7 @@ def common_elements(cutoff=92, output="string", order=None, as_set=False):
 
     * Implement ordering for e.g. incompatibility.
     """
-    elements = [el for el in pt.elements if not (str(el) == "n" or el.number > cutoff)]
+    elements = list(_elements_up_to(cutoff))
 
     if as_set:
         return set(map(str, elements))
@@ -88,6 +89,12 @@ def common_elements(cutoff=92, output="string", order=None, as_set=False):
         return elements
 
 
+@functools.lru_cache(maxsize=None)  # cache outputs for speed
+def _elements_up_to(cutoff=92):
+    """Get a tuple of elements up to a particular cutoff atomic number."""
+    return tuple(el for el in pt.elements if not (str(el) == "n" or el.number > cutoff))
+
+
 def REE(output="string", dropPm=True):
     """
     Provides a list of Rare Earth Elements.
@@ -173,7 +180,6 @@ def REY(output="string", dropPm=True):
     return elements
 
 
-# this uses unhashable objects in the call, cannot be optimised using LRU cache
 def common_oxides(
     elements: list = [],
     output="string",
@@ -213,12 +219,14 @@ def common_oxides(
     * Conditional additional components on the presence of others (e.g. Fe - FeOT)
     """
     if not elements:
-        elements = _common_elements - set(exclude)
+        elements = sorted(_common_elements - set(exclude))
     else:
         # Check that all elements input are indeed elements..
         pass
-
-    oxides = [ox for el in elements for ox in simple_oxides(el, output=output)]
+    # the list arguments aren't hashable, so the oxides are cached for tuples
+    oxides = list(_oxides_of(tuple(elements)))
+    if output == "formula":  # new formulae each call, these aren't cached
+        oxides = [pt.formula(ox) for ox in oxides]
 
     if as_set:
         return set(map(str, oxides + addition))
@@ -228,6 +236,12 @@ def common_oxides(
         return oxides
 
 
+@functools.lru_cache(maxsize=None)  # cache outputs for speed
+def _oxides_of(elements):
+    """Get a tuple of the simple oxide names for a tuple of elements."""
+    return tuple(ox for el in elements for ox in simple_oxides(el))
+
+
 def simple_oxides(cation, output="string"):
     """
     Creates a list of oxides for a cationic element (oxide of ions with c=1+ and above).
@@ -244,6 +258,15 @@ def simple_oxides(cation, output="string"):
     :class:`list` | :class:`set`
         List of oxides.
     """
+    oxides = _simple_oxides(cation)
+    if output == "formula":
+        return [pt.formula(ox) for ox in oxides]
+    return list(oxides)
+
+
+@functools.lru_cache(maxsize=None)  # cache outputs for speed
+def _simple_oxides(cation):
+    """Get a tuple of the simple oxide names for a cation."""
     try:
         if not isinstance(cation, pt.core.Element):
             catstr = titlecase(cation)  # edge case of lowercase str such as 'cs'
@@ -259,11 +282,7 @@ def simple_oxides(cation, output="string"):
         else str(cation) + str(2) + "O" + str(c)
         for c in ions
     ]
-    oxides = [pt.formula(ox) for ox in oxides]
-
-    if not output == "formula":
-        oxides = [str(ox) for ox in oxides]
-    return oxides
+    return tuple(str(pt.formula(ox)) for ox in oxides)
 
 
 def get_cations(component: str, exclude=[], total_suffix="T"):
@@ -288,11 +307,18 @@ def get_cations(component: str, exclude=[], total_suffix="T"):
     """
     if isinstance(component, str):
         component = remove_suffix(component, suffix=total_suffix)
+    else:
+        component = str(component)  # formulae aren't hashable, so use a string
+
+    exclude = frozenset(exclude) | {"O"}
+    return list(_cations_of(component, exclude))
+
 
-    exclude += ["O"]
+@functools.lru_cache(maxsize=None)  # cache outputs for speed
+def _cations_of(component, exclude):
+    """Get a tuple of the cations in a component, excluding a set of anions."""
     atms = pt.formula(component).atoms
-    cations = [el for el in atms.keys() if not el.__str__() in exclude]
-    return cations
+    return tuple(el for el in atms.keys() if not el.__str__() in exclude)
 
 
 def get_isotopes(ratio_text):
@@ -531,6 +557,8 @@ get_ionic_radii.__doc__ = get_ionic_radii.__doc__.replace(
 __db__ = TinyDB(
     str(pyrolite_datafolder(subfolder="geochem") / "geochemdb.json"), access_mode="r"
 )
-_common_elements = set(__db__.search(Query().name == "elements")[0]["collection"])
-_common_oxides = set(__db__.search(Query().name == "oxides")[0]["collection"])
+_common_elements = frozenset(__db__.search(Query().name == "elements")[0]["collection"])
+_common_oxides = frozenset(__db__.search(Query().name == "oxides")[0]["collection"])
 __db__.close()
+_REE = frozenset(REE())
+_REY = frozenset(REY())
@@ -1,6 +1,7 @@
 """
 Reference compostitions and compositional normalisation.
 """
+import functools
 import json
 from pathlib import Path
 
@@ -61,6 +62,35 @@ def get_reference_composition(name):
     return Composition(json.loads(composition), name=name)
 
 
+@functools.lru_cache(maxsize=64)  # bounded, as keys include arbitrary column sets
+def _reference_abundances(name, units, components):
+    """
+    Get the abundances of a set of components from a reference composition in the
+    database.
+
+    Parameters
+    ------------
+    name : :class:`str`
+        Name of the reference composition model.
+    units : :class:`str` | :code:`None`
+        Units to return the abundances in. If :code:`None`, those of the reference
+        composition will be used.
+    components : :class:`tuple`
+        Components to get abundances for.
+
+    Returns
+    --------
+    :class:`numpy.ndarray`
+        Read-only array of abundances.
+    """
+    reference = get_reference_composition(name)
+    if units is not None:
+        reference.set_units(units)
+    abundances = np.array(reference[list(components)], dtype=float)
+    abundances.flags.writeable = False  # this is shared between calls
+    return abundances
+
+
 def get_reference_files(directory=None, formats=["csv"]):
     """
     Get a list of the reference composition files.
@@ -105,6 +135,7 @@ def update_database(path=None, encoding="cp1252", **kwargs):
                 {"name": C.name, "composition": C._df.T.to_json(force_ascii=False)}
             )
         db.close()
+    _reference_abundances.cache_clear()
 
 
 class Composition(object):
@@ -138,6 +169,7 @@ class Composition(object):
         self.comp = None
         self.units = None
         self.unc_2sigma = None
+        self._positions = None
 
         self.name = name
         self.reference = reference
@@ -265,6 +297,16 @@ class Composition(object):
                 desc += "doi: {}".format(metadata["DOI"])
         return to_width(desc, **kwargs)
 
+    def _get_positions(self):
+        """
+        Get a mapping of variable names to their column positions within the
+        composition, cached against the current column index.
+        """
+        columns = self.comp.columns
+        if self._positions is None or self._positions[0] is not columns:
+            self._positions = (columns, {c: i for i, c in enumerate(columns)})
+        return self._positions[1]
+
     def __getitem__(self, variables):
         """
         Allow access to model values via [] indexing e.g. Composition['Si', 'Cr'].
@@ -274,11 +316,19 @@ class Composition(object):
         variables : :class:`str` | :class:`list`
             Variable(s) to get.
         """
-        if isinstance(variables, (list, np.ndarray, pd.Index)):  # if iterable
-            variables = [v if isinstance(v, str) else str(v) for v in variables]
-        else:
-            variables = [str(variables)]
-        qry = self.comp.reindex(columns=variables).values.flatten()
+        if not isinstance(variables, (list, np.ndarray, pd.Index)):  # if not iterable
+            variables = [variables]
+        # positions of the variables within the composition, -1 where absent; names
+        # are converted to strings once as they're looked up
+        positions = self._get_positions()
+        idx = np.fromiter(
+            (positions.get(str(v), -1) for v in variables),
+            dtype=int,
+            count=len(variables),
+        )
+        present = idx >= 0
+        qry = np.full(len(variables), np.nan)
+        qry[present] = self.comp.values[0, idx[present]]
         if len(qry) == 1:
             qry = qry[0]
         return qry
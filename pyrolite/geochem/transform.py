@@ -1,6 +1,8 @@
 """
 Functions for converting, transforming and parameterizing geochemical data.
 """
+import functools
+
 import numpy as np
 import pandas as pd
 import periodictable as pt
@@ -12,16 +14,86 @@ from ..util.meta import update_docstring_references
 from ..util.text import remove_suffix, titlecase
 from ..util.types import iscollection
 from .ind import (
+    REE,
     _common_elements,
     _common_oxides,
+    _simple_oxides,
     get_cations,
     get_ionic_radii,
     simple_oxides,
 )
-from .norm import Composition, get_reference_composition
+from .norm import Composition, _reference_abundances, get_reference_composition
 
 logger = Handle(__name__)
 
+# canonical REE order and positions, used to build masks for lambda fits
+_REE_ORDER = tuple(REE(dropPm=False))
+_REE_INDEX = {e: i for i, e in enumerate(_REE_ORDER)}
+
+
+@functools.lru_cache(maxsize=None)  # cache outputs for speed
+def _formula_mass(component):
+    """
+    Get the molar mass of a component.
+
+    Parameters
+    ----------
+    component : :class:`str`
+        Component to get the mass of.
+
+    Returns
+    -------
+    :class:`float`
+    """
+    return pt.formula(component).mass
+
+
+def _formula_masses(components):
+    """
+    Get the molar masses of a set of components.
+
+    Parameters
+    ----------
+    components : :class:`list` | :class:`pandas.Index`
+        Components to get the masses of.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+    """
+    return np.fromiter(
+        (_formula_mass(c) for c in components), dtype=float, count=len(components)
+    )
+
+
+def _component_masses(df):
+    """
+    Get the molar masses of the components of a dataframe, or of a series named by
+    a single component (a :class:`ValueError` is raised for unnamed series).
+
+    Parameters
+    ----------
+    df : :class:`pandas.DataFrame` | :class:`pandas.Series`
+        Dataframe or series to get the component masses for.
+
+    Returns
+    -------
+    :class:`float` | :class:`numpy.ndarray`
+        Masses, given as a single float for a series or single-column dataframe.
+    """
+    if isinstance(df, pd.Series):
+        msg = "Series need to be named by a component, not {}.".format(df.name)
+        try:
+            mass = _formula_mass(df.name) if df.name is not None else 0.0
+        except Exception:  # e.g. names which can't be parsed as a formula
+            raise ValueError(msg)
+        if not mass:
+            raise ValueError(msg)
+        return mass
+    if df.columns.size == 1:  # a scalar avoids aligning an array with the columns
+        return _formula_mass(df.columns[0])
+    return _formula_masses(df.columns)
+
 
 def to_molecular(df: pd.DataFrame, renorm=True):
     """
@@ -29,23 +101,23 @@ def to_molecular(df: pd.DataFrame, renorm=True):
 
     Parameters
     -----------
-    df : :class:`pandas.DataFrame`
-        Dataframe to transform.
+    df : :class:`pandas.DataFrame` | :class:`pandas.Series`
+        Dataframe to transform, or a series named by a single component.
     renorm : :class:`bool`, :code:`True`
         Whether to renormalise the dataframe after converting to relative moles.
+        Series are not renormalised.
 
     Returns
     -------
-    :class:`pandas.DataFrame`
+    :class:`pandas.DataFrame` | :class:`pandas.Series`
         Transformed dataframe.
 
     Notes
     ------
     Does not convert units (i.e. mass% --> mol%; mass-ppm --> mol-ppm).
     """
-    # df = df.to_frame()
-    MWs = [pt.formula(c).mass for c in df.columns]
-    if renorm:
+    MWs = _component_masses(df)
+    if renorm and not isinstance(df, pd.Series):
         return renormalise(df.div(MWs))
     else:
         return df.div(MWs)
@@ -57,23 +129,23 @@ def to_weight(df: pd.DataFrame, renorm=True):
 
     Parameters
     -----------
-    df : :class:`pandas.DataFrame`
-        Dataframe to transform.
+    df : :class:`pandas.DataFrame` | :class:`pandas.Series`
+        Dataframe to transform, or a series named by a single component.
     renorm : :class:`bool`, :code:`True`
         Whether to renormalise the dataframe after converting to relative moles.
+        Series are not renormalised.
 
     Returns
     -------
-    :class:`pandas.DataFrame`
+    :class:`pandas.DataFrame` | :class:`pandas.Series`
         Transformed dataframe.
 
     Notes
     -------
     Does not convert units (i.e. mol% --> mass%; mol-ppm --> mass-ppm).
     """
-    # df = df.to_frame()
-    MWs = [pt.formula(c).mass for c in df.columns]
-    if renorm:
+    MWs = _component_masses(df)
+    if renorm and not isinstance(df, pd.Series):
         return renormalise(df.multiply(MWs))
     else:
         return df.multiply(MWs)
@@ -101,36 +173,36 @@ def devolatilise(
     :class:`pandas.DataFrame`
         Transformed dataframe.
     """
-    keep = [i for i in df.columns if not i in exclude]
+    keep = ~df.columns.isin(exclude)
     if renorm:
         return renormalise(df.loc[:, keep])
     else:
         return df.loc[:, keep]
 
 
-def oxide_conversion(oxin, oxout, molecular=False):
+@functools.lru_cache(maxsize=None)  # cache outputs for speed
+def _oxide_conversion_factor(oxin, oxout, molecular=False):
     """
-    Factory function to generate a function to convert oxide components between
-    two elemental oxides, for use in redox recalculations.
+    Get the factor to convert abundances of one elemental oxide component to another.
 
     Parameters
     ----------
-    oxin : :class:`str` | :class:`~periodictable.formulas.Formula`
+    oxin : :class:`str`
         Input component.
-    oxout : :class:`str` | :class:`~periodictable.formulas.Formula`
+    oxout : :class:`str`
         Output component.
     molecular : :class:`bool`, :code:`False`
-        Whether to apply the conversion for molecular data.
+        Whether to get the factor for molecular data.
 
     Returns
     -------
-        Function to convert a :class:`pandas.Series` from one elment-oxide
-        component to another.
+    :class:`float`
+
+    Notes
+    ------
+    Components are specified as strings such that the factors can be cached.
     """
-    if not isinstance(oxin, pt.formulas.Formula):
-        oxin = pt.formula(oxin)
-    if not isinstance(oxout, pt.formulas.Formula):
-        oxout = pt.formula(oxout)
+    oxin, oxout = pt.formula(oxin), pt.formula(oxout)
 
     inatoms = {k: v for (k, v) in oxin.atoms.items() if not str(k) == "O"}
     in_els = inatoms.keys()
@@ -144,14 +216,39 @@ def oxide_conversion(oxin, oxout, molecular=False):
         raise ValueError("Incompatible compounds: {} --> {}".format(in_els, out_els))
     # Moles of product vs. moles of reactant
     cation_coefficient = list(inatoms.values())[0] / list(outatoms.values())[0]
+    if molecular:
+        return cation_coefficient
+    return cation_coefficient * oxout.mass / oxin.mass
+
+
+def oxide_conversion(oxin, oxout, molecular=False):
+    """
+    Factory function to generate a function to convert oxide components between
+    two elemental oxides, for use in redox recalculations.
+
+    Parameters
+    ----------
+    oxin : :class:`str` | :class:`~periodictable.formulas.Formula`
+        Input component.
+    oxout : :class:`str` | :class:`~periodictable.formulas.Formula`
+        Output component.
+    molecular : :class:`bool`, :code:`False`
+        Whether to apply the conversion for molecular data.
+
+    Returns
+    -------
+        Function to convert a :class:`pandas.Series` from one elment-oxide
+        component to another.
+    """
+    if not isinstance(oxin, pt.formulas.Formula):
+        oxin = pt.formula(oxin)
+    if not isinstance(oxout, pt.formulas.Formula):
+        oxout = pt.formula(oxout)
+    _oxide_conversion_factor(str(oxin), str(oxout))  # check the components match
 
     def convert_series(dfser: pd.Series, molecular=molecular):
-        if molecular:
-            factor = cation_coefficient
-        else:
-            factor = cation_coefficient * oxout.mass / oxin.mass
-        converted = dfser * factor
-        return converted
+        factor = _oxide_conversion_factor(str(oxin), str(oxout), molecular=molecular)
+        return dfser * factor
 
     doc = "Convert series from " + str(oxin) + " to " + str(oxout)
     convert_series.__doc__ = doc
@@ -190,18 +287,20 @@ def elemental_sum(
     """
     assert component is not None
     if isinstance(component, (list, tuple, dict)):
-        cations = [get_cations(t, total_suffix=total_suffix)[0] for t in component]
-        assert all([c == cations[0] for c in cations])
-        cation = cations[0]
+        component = list(component)
+        cation = get_cations(component[0], total_suffix=total_suffix)[0]
+        assert all(
+            get_cations(t, total_suffix=total_suffix)[0] == cation
+            for t in component[1:]
+        )
     else:
         cation = get_cations(component, total_suffix=total_suffix)[0]
 
     cationname = str(cation)
     logger.debug("Agregating {} Data.".format(cationname))
     # different species
-    poss_specs = [cationname] + simple_oxides(cation)
-    poss_specs += [i + total_suffix for i in poss_specs]
-    species = [i for i in set(poss_specs) if i in df.columns]
+    poss_specs = _possible_species(cationname, total_suffix=total_suffix)
+    species = [i for i in poss_specs if i in df.columns]
     if not species:
         logger.warning(
             "No relevant species ({}) found to aggregate.".format(poss_specs)
@@ -209,7 +308,7 @@ def elemental_sum(
         # return nulls
         subsum = pd.Series(np.ones(df.index.size) * np.nan, index=df.index)
     else:
-        subset = np.array(df.loc[:, species])
+        subset = df[species].to_numpy(dtype=float)
         if logdata:
             logger.debug("Inverse-log-transforming {} data.".format(cationname))
             subset = np.exp(subset)
@@ -221,30 +320,98 @@ def elemental_sum(
         )
         conversion_coeff = np.array(
             [
-                oxide_conversion(
+                _oxide_conversion_factor(
                     remove_suffix(s, suffix=total_suffix),
                     cationname,
                     molecular=molecular,
-                )(1)
+                )
                 for s in species
             ]
         )
-        subset *= conversion_coeff
+        subset = subset * conversion_coeff  # new array, subset may be a view of df
         logger.debug("Zeroing non-finite and negative {} values.".format(cationname))
-        subset[(~np.isfinite(subset)) | (subset < 0.0)] = 0.0
+        invalid = ~np.isfinite(subset)
+        np.logical_or(invalid, subset < 0.0, out=invalid)
+        subset[invalid] = 0.0
         subsum = subset.sum(axis=1)
         subsum[subsum <= 0.0] = np.nan
 
     if to is None:
         return pd.Series(subsum, index=df.index, name=cationname)
     else:
+        toform = remove_suffix(str(to), suffix=total_suffix)  # e.g. FeOT -> FeO
         return pd.Series(
-            oxide_conversion(cationname, to, molecular=molecular)(subsum),
+            subsum * _oxide_conversion_factor(cationname, toform, molecular=molecular),
             index=df.index,
             name=to,
         )
 
 
+@functools.lru_cache(maxsize=None)  # cache outputs for speed
+def _possible_species(cationname, total_suffix="T"):
+    """
+    Get the species names (the element, its simple oxides and their totals) under
+    which a cation may be recorded.
+
+    Parameters
+    ----------
+    cationname : :class:`str`
+        Name of the cation.
+    total_suffix : :class:`str`, :code:`"T"`
+        Suffix of 'total' variables. E.g. 'T' for FeOT, Fe2O3T.
+
+    Returns
+    -------
+    :class:`tuple`
+    """
+    poss_specs = (cationname,) + _simple_oxides(cationname)
+    poss_specs += tuple(i + total_suffix for i in poss_specs)
+    return tuple(dict.fromkeys(poss_specs))  # unique, in a consistent order
+
+
+def _ratio_component(df: pd.DataFrame, component, total_suffix="T", molecular=False):
+    """
+    Get the abundance of one component of a ratio as a float array, where
+    non-positive and non-finite values are replaced by :code:`np.nan`.
+
+    Parameters
+    ----------
+    df : :class:`pandas.DataFrame`
+        Dataframe to get the component abundance from.
+    component : :class:`str`
+        Component to get the abundance of.
+    total_suffix : :class:`str`, 'T'
+        Suffix of 'total' variables. E.g. 'T' for FeOT, Fe2O3T.
+    molecular : :class:`bool`, :code:`False`
+        Flag that data is in molecular units, rather than weight units.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+
+    Notes
+    -----
+    Where the component is the only species of its cation present in the dataframe,
+    the column is used directly rather than being aggregated by
+    :func:`~pyrolite.geochem.transform.elemental_sum`.
+    """
+    if component in df.columns:
+        cationname = str(get_cations(component, total_suffix=total_suffix)[0])
+        present = [
+            s
+            for s in _possible_species(cationname, total_suffix=total_suffix)
+            if s in df.columns
+        ]
+        if present == [component]:
+            values = df[component].to_numpy(dtype=float)
+            with np.errstate(invalid="ignore"):
+                valid = np.isfinite(values) & (values > 0.0)
+            return np.where(valid, values, np.nan)
+    return elemental_sum(
+        df, component, to=component, total_suffix=total_suffix, molecular=molecular
+    ).to_numpy(dtype=float)
+
+
 def aggregate_element(
     df: pd.DataFrame, to, total_suffix="T", logdata=False, renorm=False, molecular=False
 ):
@@ -281,6 +448,53 @@ def aggregate_element(
     :class:`pandas.DataFrame`
         Dataframe with cation aggregated to the desired species.
     """
+    if isinstance(to, list):  # only used for grouped targets in convert_chemistry
+        raise NotImplementedError("Not yet implemented for tuples, lists, arrays etc.")
+    targetnames, values, drop = _aggregate_element_targets(
+        df, to, total_suffix=total_suffix, logdata=logdata, molecular=molecular
+    )
+    if drop:
+        logger.debug("Dropping redundant columns: {}".format(", ".join(drop)))
+        df = df.drop(columns=drop)
+
+    df.loc[:, targetnames] = values  # missing target columns are added here
+    if renorm:
+        return renormalise(df)
+    else:
+        return df
+
+
+def _aggregate_element_targets(
+    df: pd.DataFrame, to, total_suffix="T", logdata=False, molecular=False
+):
+    """
+    Calculate the abundances of target species for
+    :func:`~pyrolite.geochem.transform.aggregate_element`, without modifying the
+    dataframe.
+
+    Parameters
+    ----------
+    df : :class:`pandas.DataFrame`
+        DataFrame for which to aggregate cation data.
+    to : :class:`str` | :class:`~periodictable.core.Element` | :class:`~periodictable.formulas.Formula`  | :class:`dict` | :class:`list`
+        Component(s) to convert to. Components given in a list (which need to share
+        a cation) each represent the full elemental sum.
+    total_suffix : :class:`str`, 'T'
+        Suffix of 'total' variables. E.g. 'T' for FeOT, Fe2O3T.
+    logdata : :class:`bool`, :code:`False`
+        Whether the data has been log transformed.
+    molecular : :class:`bool`, :code:`False`
+        Whether to perform a sum of molecular data.
+
+    Returns
+    -------
+    targetnames : :class:`list`
+        Names of the target species.
+    values : :class:`numpy.ndarray`
+        Abundances of the target species, with one column per target.
+    drop : :class:`list`
+        Names of the redundant species to be dropped from the dataframe.
+    """
     # get the elemental sum for the specified cation
     subsum = elemental_sum(
         df, to, total_suffix=total_suffix, logdata=logdata, molecular=molecular
@@ -290,21 +504,20 @@ def aggregate_element(
     species = simple_oxides(cation)
     species += [i + total_suffix for i in species]
     species = [i for i in species if i in df.columns]
-    _df = df.copy()
     if isinstance(to, str):
         logger.debug("Aggregating string-specified component {}.".format(to))
         toform = remove_suffix(to, suffix=total_suffix)
         drop = [i for i in species if str(i) != to]
         targetnames = [to]
         props = [1.0]  # 100%
-        coeff = [oxide_conversion(cation, toform, molecular=molecular)(1)]
+        coeff = [_oxide_conversion_factor(cation, toform, molecular=molecular)]
     elif isinstance(to, (pt.core.Element, pt.formulas.Formula)):
         logger.debug("Aggregating object-specified component {}.".format(to))
         to = str(to)
         drop = [i for i in species if str(i) != to]
         targetnames = [to]
         props = [1.0]  # 100%
-        coeff = [oxide_conversion(cation, to, molecular=molecular)(1)]
+        coeff = [_oxide_conversion_factor(cation, to, molecular=molecular)]
     elif isinstance(to, dict):
         logger.debug(
             "Aggregating dict-specified components {}.".format(",".join(to.keys()))
@@ -317,9 +530,26 @@ def aggregate_element(
             props = close(_props.T).T
         else:
             props = close(_props)  # proportions are a series of floats
+        factors = np.array(
+            [
+                _oxide_conversion_factor(cation, t, molecular=molecular)
+                for t in targetnames
+            ]
+        )
+        coeff = (props.T * factors).T  # scale the proportions for each component
+        drop = [i for i in species if str(i) not in targetnames]
+    elif isinstance(to, list):
+        # several components, each of which represents the full elemental sum
+        targetnames = [str(t) for t in to]
+        logger.debug(
+            "Aggregating list-specified components {}.".format(",".join(targetnames))
+        )
+        props = np.ones(len(targetnames))
         coeff = [
-            oxide_conversion(cation, t, molecular=molecular)(p)
-            for t, p in zip(targetnames, props)
+            _oxide_conversion_factor(
+                cation, remove_suffix(t, suffix=total_suffix), molecular=molecular
+            )
+            for t in targetnames
         ]
         drop = [i for i in species if str(i) not in targetnames]
     else:
@@ -337,29 +567,17 @@ def aggregate_element(
         )
     )
 
-    for t in targetnames:
-        if t not in _df:
-            _df[t] = 0  # avoid missing column errors
-
-    coeff = np.array(coeff)
-    if coeff.ndim == 2:
-        _df.loc[:, targetnames] = subsum.values[:, np.newaxis] * coeff.T
-    else:
-        _df.loc[:, targetnames] = subsum.values[:, np.newaxis] @ coeff[np.newaxis, :]
+    coeff = np.array(coeff, dtype=float)
+    # outer product of the elemental sum and coefficients, for each row and target
+    values = np.empty((subsum.size, len(targetnames)))
+    np.multiply(subsum.to_numpy(dtype=float)[:, np.newaxis], coeff.T, out=values)
 
     if logdata:
         logger.debug("Log-transforming {} Data.".format(cation))
-        _df.loc[:, targetnames] = _df.loc[:, targetnames].applymap(np.log)
+        np.log(values, out=values)
 
-    if drop:
-        logger.debug("Dropping redundant columns: {}".format(", ".join(drop)))
-        df = df.drop(columns=drop)
-
-    df.loc[:, targetnames] = _df.loc[:, targetnames].replace(0, np.nan)
-    if renorm:
-        return renormalise(df)
-    else:
-        return df
+    values[values == 0.0] = np.nan
+    return targetnames, values, drop
 
 
 def get_ratio(
@@ -412,10 +630,12 @@ def get_ratio(
     name = [ratio if ((not alias) or (alias is None)) else alias][0]
     logger.debug("Calculating Ratio: {}".format(name))
     numsum, densum = (
-        elemental_sum(df, num, to=num, molecular=molecular),
-        elemental_sum(df, den, to=den, molecular=molecular),
+        _ratio_component(df, num, molecular=molecular),
+        _ratio_component(df, den, molecular=molecular),
     )
-    ratio = numsum / densum
+    # calculate the ratio on the underlying arrays, non-finite values are removed below
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.divide(numsum, densum)
 
     if _to_norm or (norm_to is not None):  # if molecular, this will need to change
         if isinstance(norm_to, str):
@@ -442,9 +662,8 @@ def get_ratio(
         logger.debug("Normalizing Ratio: {}".format(name))
         ratio /= norm_ratio
 
-    ratio[~np.isfinite(ratio.values)] = np.nan  # avoid inf
-    ratio.name = name
-    return ratio
+    ratio[~np.isfinite(ratio)] = np.nan  # avoid inf
+    return pd.Series(ratio, index=df.index, name=name)
 
 
 def add_MgNo(
@@ -487,13 +706,11 @@ def add_MgNo(
     else:
         fltr = [i for i in df.columns if "Fe2O3" not in i]  # exclude ferric iron
         fe = elemental_sum(df.loc[:, fltr], "Fe", molecular=molecular)
+    mg_name, fe_name = mg.name, fe.name
+    mg, fe = mg.to_numpy(dtype=float), fe.to_numpy(dtype=float)
     if not molecular:  # convert these outputs to molecular, unless already so
-        mg, fe = (
-            to_molecular(mg.to_frame(), renorm=False),
-            to_molecular(fe.to_frame(), renorm=False),
-        )
-
-    mgnos = mg.values / (mg.values + fe.values)
+        mg, fe = mg / _formula_mass(mg_name), fe / _formula_mass(fe_name)
+    mgnos = mg / (mg + fe)
     if mgnos.size:  # to cope with empty arrays
         df[name] = mgnos
     else:
@@ -569,15 +786,21 @@ def lambda_lnREE(
     """
     # if there are no supplied params, they will be calculated in calc_lambdas
     ree = df.pyrochem.list_REE  # this excludes Pm
-    # initialize normdf
-    norm_df = df.loc[:, ree].copy()
+    # the REE data are processed as an array, which is used to initialize normdf
+    values = df.pyrochem.REE.to_numpy(dtype=float)
+    null = np.isnan(values)
+    # mask over the canonical REE order indicating which are used in the fit
+    fit_mask = np.ones(len(_REE_ORDER), dtype=bool)
+    for e in exclude:
+        if e in _REE_INDEX:
+            fit_mask[_REE_INDEX[e]] = False
     # check if there are columns which are empty
-    empty = list(norm_df.columns[norm_df.isnull().all(axis=0)])
-    if empty:
-        logger.debug("Empty columns found: {}".format(", ".join(empty)))
-        exclude += empty
+    empty = null.all(axis=0)
+    if empty.any():
+        logger.debug("Empty columns found: {}".format(", ".join(np.array(ree)[empty])))
+    ree_fit = fit_mask[[_REE_INDEX[e] for e in ree]] & ~empty
 
-    if norm_df.columns.size < min_elements:
+    if len(ree) < min_elements:
         msg = (
             "Dataframe size below minimum number of elements required to conduct a fit."
         )
@@ -585,9 +808,7 @@ def lambda_lnREE(
 
     if norm_to is not None:  # None = already normalised data
         if isinstance(norm_to, str):
-            norm = get_reference_composition(norm_to)
-            norm.set_units(scale)
-            norm_abund = norm[ree]
+            norm_abund = _reference_abundances(norm_to, scale, tuple(ree))
         elif isinstance(norm_to, Composition):
             norm = norm_to
             norm.set_units(scale)
@@ -596,10 +817,10 @@ def lambda_lnREE(
             norm_abund = np.array(norm_to)
             assert len(norm_abund) == len(ree)
 
-        norm_df.loc[:, ree] = np.divide(norm_df.loc[:, ree].values, norm_abund)
+        values = np.divide(values, norm_abund)
 
-    norm_df.loc[(norm_df <= 0.0).any(axis=1), :] = np.nan  # remove zero or below
-    norm_df.loc[:, ree] = np.log(norm_df.loc[:, ree])
+    values[(values <= 0.0).any(axis=1), :] = np.nan  # remove zero or below
+    values = np.log(values)
 
     if not (sigmas is None):
         if isinstance(sigmas, pd.Series):  # convert this to an array
@@ -607,28 +828,27 @@ def lambda_lnREE(
 
     if not allow_missing:
         # nullify rows with missing data
-        missing = pd.isnull(df.loc[:, ree]).any(axis=1)
+        missing = null.any(axis=1)
         if missing.any():
             logger.debug("Ignoring {} rows with missing data.".format(missing.sum()))
-            norm_df.loc[missing, :] = np.nan
+            values[missing, :] = np.nan
 
-    row_filter = norm_df.count(axis=1) >= min_elements
+    row_filter = (~np.isnan(values)).sum(axis=1) >= min_elements
+    norm_df = pd.DataFrame(values, index=df.index, columns=ree)
 
-    lambdadf = pd.DataFrame(
-        index=norm_df.index,
-        dtype="float32",
-    )
     ls = lambdas.calc_lambdas(
         norm_df.loc[row_filter, :],
-        exclude=exclude,
+        exclude=norm_df.columns[~ree_fit].tolist(),
         params=params,
         degree=degree,
         algorithm=algorithm,
         sigmas=sigmas,
         **kwargs
     )
-    lambdadf.loc[row_filter, ls.columns] = ls
-    assert lambdadf.index.size == df.index.size
+    # fill a preallocated array, rows which weren't fit remain null
+    lambda_values = np.full((df.index.size, ls.columns.size), np.nan)
+    lambda_values[row_filter] = ls.to_numpy(dtype=float)
+    lambdadf = pd.DataFrame(lambda_values, index=df.index, columns=ls.columns)
     return lambdadf
 
 
@@ -752,8 +972,31 @@ def convert_chemistry(
         )
 
     # Aggregate the singular compositional items, then get new columns
-    for item in output_compositional:
-        df = aggregate_element(df, to=item, logdata=logdata, molecular=molecular)
+    if output_compositional:
+        # items are grouped by cation, such that each elemental sum is calculated
+        # once, from the same frame, and the targets are added in a single step
+        by_cation = {}
+        for item in output_compositional:
+            by_cation.setdefault(str(get_cations(item)[0]), []).append(item)
+        aggregated = [
+            _aggregate_element_targets(
+                df,
+                to=items if len(items) > 1 else items[0],
+                logdata=logdata,
+                molecular=molecular,
+            )
+            for items in by_cation.values()
+        ]
+        targetnames = [t for (names, _, _) in aggregated for t in names]
+        drop = list(
+            dict.fromkeys(
+                c for (_, _, _drop) in aggregated for c in _drop if c not in targetnames
+            )
+        )
+        if drop:
+            logger.debug("Dropping redundant columns: {}".format(", ".join(drop)))
+            df = df.drop(columns=drop)
+        df.loc[:, targetnames] = np.hstack([values for (_, values, _) in aggregated])
 
     ####################################################################################
     # Handle Ratios
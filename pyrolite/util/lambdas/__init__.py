@@ -89,13 +89,11 @@ def calc_lambdas(
         algorithm = "opt"
     # this is what will be passed to the fit
     #  to cacluate an anomaly rather than a residual, exclude the element from the fit
-    exclude += anomalies
+    exclude = list(exclude) + list(anomalies)
     if exclude:
         logger.debug("Excluding columns from the fit: " + ",".join(exclude))
     # these are the REE which the lambdas will be EVALUATED at; exclude empty columns
-    column_fltr = [
-        (c not in exclude) and (np.isfinite(df[c]).sum() > 0) for c in df.columns
-    ]
+    column_fltr = ~df.columns.isin(exclude) & np.isfinite(df.values).any(axis=0)
     columns = df.columns[column_fltr].tolist()
     if not columns:
         msg = "No columns specified (after exclusion), nothing to calculate."
@@ -77,7 +77,8 @@ def get_lambda_poly_function(lambdas: np.ndarray, params=None, radii=None, degre
     Parameters
     ------------
     lambdas: :class:`numpy.ndarray`
-        Lambda values to weight combination of polynomials.
+        Lambda values to weight combination of polynomials. A 2D array with one set of
+        lambdas per row can be used to evaluate a number of profiles at once.
     params: :class:`list` ( :class:`tuple` )
         Parameters for the orthogonal polynomial decomposition.
     radii: :class:`numpy.ndarray`
@@ -101,6 +102,7 @@ def get_lambda_poly_function(lambdas: np.ndarray, params=None, radii=None, degre
         msg = """Must provide either x values to construct parameters,
                  or the parameters themselves."""
         raise AssertionError(msg)
+    lambdas = np.asarray(lambdas)
 
     def _lambda_evaluator(xarr):
         """
@@ -111,6 +113,12 @@ def get_lambda_poly_function(lambdas: np.ndarray, params=None, radii=None, degre
         -----------
         xarr: :class:`numpy.ndarray`
             X values at which to evaluate the function.
+
+        Returns
+        --------
+        :class:`numpy.ndarray`
+            Function values, with one row per set of lambdas where a 2D array of
+            lambdas was supplied.
         """
         func_components = np.array([lambda_poly(xarr, pset) for pset in params])
         return np.dot(lambdas, func_components)
@@ -93,6 +93,7 @@ def lambdas_ONeill2016(
     s = np.ones((y.shape[0], xd)) * np.nan
     χ2 = np.ones((y.shape[0], 1)) * np.nan
 
+    V = np.vander(rad, xd, increasing=True).T
     md_inds, patterns = md_pattern(df)
     # for each missing data pattern, we create the matrix A - rather than each row
     for ind in np.unique(md_inds):
@@ -101,13 +102,9 @@ def lambdas_ONeill2016(
         if missing_fltr.sum():  # ignore completely empty rows
             yd = missing_fltr.sum()  # number of elements used for the fit
             A = get_polynomial_matrix(rad[missing_fltr], params=params)
-            invA = np.linalg.inv(A)
-            V = np.vander(rad, xd, increasing=True).T
-            Z = (
-                y[np.ix_(row_fltr, missing_fltr)][:, np.newaxis]
-                * V[np.newaxis, :, missing_fltr]
-            ).sum(axis=-1)
-            _B = (invA @ Z.T).T
+            _y = y[np.ix_(row_fltr, missing_fltr)]
+            Z = _y @ V[:, missing_fltr].T  # all rows with this pattern at once
+            _B = np.linalg.solve(A, Z.T).T
 
             ############################################################################
             _sigmas = sigmas[missing_fltr]
@@ -117,7 +114,7 @@ def lambdas_ONeill2016(
 
             est = (X[missing_fltr, :] @ _B.T).T  # modelled values
             # residuals over all rows
-            residuals = (df.loc[row_fltr, missing_fltr] - est).values
+            residuals = _y - est
             dof = yd - xd  # effective degrees of freedom (for this mising filter)
             # chi-sqared as SSQ / sigmas / residual degrees of freedom
             reduced_chi_squared = (residuals**2 / _sigmas**2).sum(axis=1) / dof
@@ -2,6 +2,8 @@
 Functions to generate parameters for the construction of orthogonal polynomials which
 are used to fit REE patterns.
 """
+import functools
+
 import numpy as np
 import sympy.solvers.solvers
 from sympy import symbols, var
@@ -137,10 +139,7 @@ def _get_params(params=None, degree=4):
         else:
             msg = "Parameter specification {} not recognised.".format(params)
             raise NotImplementedError(msg)
-        params = orthogonal_polynomial_constants(
-            get_ionic_radii(_ree, charge=3, coordination=8),
-            degree=degree,
-        )
+        params = list(_REE_params(tuple(_ree), degree=degree))
     else:
         # check that params is a tuple or list
         if not isinstance(params, (list, tuple)):
@@ -152,6 +151,33 @@ def _get_params(params=None, degree=4):
     return params
 
 
+@functools.lru_cache(maxsize=None)  # cache outputs for speed
+def _REE_params(ree, degree=4):
+    """
+    Get the parameters for orthogonal polynomials defined over the ionic radii of a
+    set of REE.
+
+    Parameters
+    ----------
+    ree : :class:`tuple`
+        REE to use as a basis for the orthogonal polynomials.
+    degree : :class:`int`
+        Degree of orthogonal polynomial fit.
+
+    Returns
+    --------
+    :class:`tuple`
+        Tuple of tuples containing a parameterisation of the orthogonal polynomial
+        functions.
+    """
+    return tuple(
+        orthogonal_polynomial_constants(
+            get_ionic_radii(list(ree), charge=3, coordination=8),
+            degree=degree,
+        )
+    )
+
+
 def parse_sigmas(y, sigmas=None):
     r"""
     Disambigaute a value or set of sigmas for a dataset for use in lambda-fitting
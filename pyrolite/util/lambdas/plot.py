@@ -8,11 +8,7 @@ import numpy as np
 from ... import plot
 from ...geochem.ind import REE, get_ionic_radii
 from ..log import Handle
-from .eval import (
-    get_function_components,
-    get_lambda_poly_function,
-    get_tetrads_function,
-)
+from .eval import get_function_components, get_tetrads_function, lambda_poly
 from .params import _get_params
 from .transform import REE_radii_to_z, REE_z_to_radii
 
@@ -38,26 +34,24 @@ def plot_lambdas_components(lambdas, params=None, ax=None, **kwargs):
     --------
     :class:`matplotlib.axes.Axes`
     """
+    lambdas = np.asarray(lambdas, dtype=float)  # e.g. a row of lambda_lnREE output
     degree = lambdas.size
     params = _get_params(params=params, degree=degree)
     # check the degree and parameters are of consistent degree?
-    reconstructed_func = get_lambda_poly_function(lambdas, params)
-
     ax = plot.spider.REE_v_radii(ax=ax)
 
     radii = np.array(get_ionic_radii(REE(), charge=3, coordination=8))
     xs = np.linspace(np.max(radii), np.min(radii), 100)
-    ax.plot(xs, reconstructed_func(xs), label="Regression", color="k", **kwargs)
-    for w, p in zip(lambdas, params):  # plot the components
-        l_func = get_lambda_poly_function(
-            [w], [p]
-        )  # pasing singluar vaules and one tuple
+    # evaluate the weighted components once, and sum these for the regression
+    components = lambdas[:, np.newaxis] * np.array([lambda_poly(xs, p) for p in params])
+    ax.plot(xs, components.sum(axis=0), label="Regression", color="k", **kwargs)
+    for ys, p in zip(components, params):  # plot the components
         label = (
             r"$r^{}: \lambda_{}".format(len(p), len(p))
             + [r"\cdot f_{}".format(len(p)), ""][int(len(p) == 0)]
             + "$"
         )
-        ax.plot(xs, l_func(xs), label=label, ls="--", **kwargs)  # plot the polynomials
+        ax.plot(xs, ys, label=label, ls="--", **kwargs)  # plot the polynomials
     return ax
 
 
@@ -1,3 +1,4 @@
+import functools
 import re
 import textwrap
 from string import ascii_lowercase
@@ -27,9 +28,8 @@ def normalise_whitespace(strg):
 def remove_prefix(z, prefix):
     """Remove a specific prefix from the start of a string."""
     if z.startswith(prefix):
-        return re.sub(r"^{}".format(prefix), "", z)
-    else:
-        return z
+        z = z[len(prefix) :]
+    return z
 
 
 def remove_suffix(x, suffix=" "):
@@ -63,8 +63,20 @@ def titlecase(
     -----
         * Option for retaining original CamelCase.
     """
+    return _titlecase(
+        s, tuple(exceptions), tuple(abbrv), capitalize_first, split_on, delim
+    )
+
+
+@functools.lru_cache(maxsize=None)  # cache outputs for speed
+def _titlecase(s, exceptions, abbrv, capitalize_first, split_on, delim):
+    """
+    Cached implementation of :func:`~pyrolite.util.text.titlecase`, taking tuples
+    of exceptions and abbreviations.
+    """
     # Check if abbrv in string, in which case it'll need to be split first?
     words = re.split(split_on, s)
+    retained = frozenset(exceptions + abbrv)
     out = []
     first = words[0]
     if capitalize_first and not (first in abbrv):
@@ -72,7 +84,7 @@ def titlecase(
 
     out.append(first)
     for word in words[1:]:
-        if word in exceptions + abbrv:
+        if word in retained:
             pass
         elif word.upper() in abbrv:
             word = word.upper()
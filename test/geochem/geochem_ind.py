@@ -24,6 +24,14 @@ class TestGetCations(unittest.TestCase):
             with self.subTest(cationstring=cationstring):
                 self.assertTrue(len(get_cations(cationstring)) > 1)
 
+    def test_exclude_unmodified(self):
+        """Check that the exclusion list and default aren't modified."""
+        exclude = ["S"]
+        get_cations("MgSO4", exclude=exclude)
+        self.assertEqual(exclude, ["S"])
+        get_cations("MgO")
+        self.assertEqual(get_cations.__defaults__[0], [])
+
     def test_exclude(self):
         """Checks that the exclude function works."""
         for ox, excl in [
@@ -169,6 +177,13 @@ class TestSimpleOxides(unittest.TestCase):
             with self.subTest(ox=ox):
                 self.assertIs(type(ox), str)
 
+    def test_repeated_calls(self):
+        """Check that modifying the output doesn't affect subsequent calls."""
+        oxides = simple_oxides("Fe")
+        oxides += ["FeOT"]
+        self.assertNotIn("FeOT", simple_oxides("Fe"))
+        self.assertEqual(simple_oxides(pt.Fe), simple_oxides("Fe"))
+
 
 class TestCommonOxides(unittest.TestCase):
     """Tests the common oxide generator."""
@@ -200,6 +215,18 @@ class TestCommonOxides(unittest.TestCase):
                 # All oxides are from elements contained in the list
                 self.assertIn(get_cations(ox)[0].__str__(), els)
 
+    def test_repeated_calls(self):
+        """Check repeated (cached) calls return independent outputs."""
+        els = ["Si", "Mg", "Ca"]
+        out = common_oxides(elements=els)
+        out.append("SiO2")
+        self.assertEqual(len(common_oxides(elements=els)), len(out) - 1)
+        # formulae are mutable, and shouldn't be shared between calls
+        first = common_oxides(elements=els, output="formula")
+        second = common_oxides(elements=els, output="formula")
+        self.assertEqual(list(map(str, first)), list(map(str, second)))
+        self.assertTrue(all(a is not b for (a, b) in zip(first, second)))
+
     @unittest.expectedFailure
     def test_invalid_elements(self):
         """Check the function fails for invalid input."""
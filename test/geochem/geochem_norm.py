@@ -5,6 +5,7 @@ import numpy as np
 import pyrolite
 from pyrolite.geochem.norm import (
     Composition,
+    _reference_abundances,
     all_reference_compositions,
     get_reference_composition,
     get_reference_files,
@@ -33,6 +34,15 @@ class TestComposition(unittest.TestCase):
         if C.doi is not None:
             self.assertIn("doi", desc)
 
+    def test_getitem(self):
+        C = Composition(self.filename)
+        var = C.comp.columns[0]
+        self.assertEqual(C[var], C.comp.loc["value", var])
+        out = C[[var, "NotAnElement"]]
+        self.assertEqual(out.size, 2)
+        self.assertEqual(out[0], C.comp.loc["value", var])
+        self.assertTrue(np.isnan(out[1]))
+
     def test_str(self):
         C = Composition(self.filename)
         s = str(C)
@@ -67,6 +77,23 @@ class TestGetReferenceComposition(unittest.TestCase):
         self.assertIsInstance(out, Composition)
 
 
+class TestReferenceAbundances(unittest.TestCase):
+    def setUp(self):
+        self.name = "Chondrite_PON"
+        self.components = ("La", "Ce", "Lu")
+
+    def test_default(self):
+        C = get_reference_composition(self.name)
+        C.set_units("ppm")
+        out = _reference_abundances(self.name, "ppm", self.components)
+        self.assertTrue(np.allclose(out, C[list(self.components)]))
+
+    def test_read_only(self):
+        out = _reference_abundances(self.name, "ppm", self.components)
+        self.assertFalse(out.flags.writeable)
+        self.assertIs(out, _reference_abundances(self.name, "ppm", self.components))
+
+
 class TestUpdateReferenceDataBase(unittest.TestCase):
     def setUp(self):
         self.tmppath = temp_path(suffix="refdbtest")
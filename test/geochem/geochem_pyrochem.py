@@ -48,6 +48,32 @@ class TestPyrochem(unittest.TestCase):
                 out = getattr(obj.pyrochem, index)
                 self.assertIsInstance(out, list)
 
+    def test_pyrochem_sets(self):
+        obj = self.df
+        for name, index in [
+            ("element_set", "list_elements"),
+            ("oxide_set", "list_oxides"),
+            ("REE_set", "list_REE"),
+            ("REY_set", "list_REY"),
+        ]:
+            with self.subTest(name=name):
+                out = getattr(obj.pyrochem, name)
+                self.assertIsInstance(out, frozenset)
+                self.assertTrue(all(c in out for c in getattr(obj.pyrochem, index)))
+
+    def test_pyrochem_indexes_updated_with_columns(self):
+        obj = self.df.copy(deep=True)
+        ree = obj.pyrochem.list_REE
+        ree.append("Y")  # modifying the output shouldn't modify the cached version
+        self.assertNotIn("Y", obj.pyrochem.list_REE)
+        obj = obj.drop(columns=["La"])
+        self.assertNotIn("La", obj.pyrochem.list_REE)
+        obj["La"] = 1.0
+        self.assertIn("La", obj.pyrochem.list_REE)
+        self.assertEqual(obj.pyrochem.list_REE[0], "La")  # ordered by atomic number
+        obj.drop(columns=["Ti"], inplace=True)
+        self.assertNotIn("Ti", obj.pyrochem.list_elements)
+
     def test_pyrochem_subsetters(self):
         obj = self.df
         for subset in [
@@ -62,6 +88,15 @@ class TestPyrochem(unittest.TestCase):
                 out = getattr(obj.pyrochem, subset)
                 self.assertIsInstance(out, obj.__class__)  # in this case a dataframe
 
+    def test_pyrochem_REE_subset_updated_with_columns(self):
+        obj = self.df.copy(deep=True)
+        obj = obj[obj.columns[::-1]]  # REE columns in reverse order
+        self.assertEqual(obj.pyrochem.REE.columns.tolist(), obj.pyrochem.list_REE)
+        obj.insert(0, "Lu2O3", 1.0)
+        obj = obj.drop(columns=["Ce"])
+        self.assertEqual(obj.pyrochem.REE.columns.tolist(), obj.pyrochem.list_REE)
+        self.assertTrue(np.allclose(obj.pyrochem.REE, obj[obj.pyrochem.list_REE]))
+
     def test_pyrochem_subsetter_assignment(self):
         obj = self.df
         for subset in [
@@ -75,6 +110,15 @@ class TestPyrochem(unittest.TestCase):
             with self.subTest(subset=subset):
                 setattr(obj.pyrochem, subset, getattr(obj.pyrochem, subset) * 1.0)
 
+    def test_pyrochem_subsetter_assignment_alignment(self):
+        obj = self.df.copy(deep=True)
+        start = obj.pyrochem.REE.values
+        obj.pyrochem.REE = obj.pyrochem.REE * 2.0
+        self.assertTrue(np.allclose(obj.pyrochem.REE.values, start * 2.0))
+        # values with a different row ordering are aligned on the index
+        obj.pyrochem.REE = obj.pyrochem.REE.iloc[::-1, :] / 2.0
+        self.assertTrue(np.allclose(obj.pyrochem.REE.values, start))
+
     # pyrolite.geochem.parse functions
 
     def test_pyrochem_check_multiple_cation_inclusion(self):
@@ -105,6 +149,13 @@ class TestPyrochem(unittest.TestCase):
         out = obj.pyrochem.to_weight()
         self.assertFalse(np.isclose(out.values.flatten(), start.flatten()).any())
 
+    def test_pyrochem_to_molecular_inplace(self):
+        obj = self.df.copy(deep=True).pyrochem.compositional
+        expect = obj.pyrochem.to_molecular()
+        out = obj.pyrochem.to_molecular(inplace=True)
+        self.assertIs(out, obj)
+        self.assertTrue(np.allclose(obj.values, expect.values))
+
     def test_pyrochem_add_MgNo(self):
         obj = self.df.copy(deep=True).pyrochem.compositional
         obj.pyrochem.add_MgNo()
@@ -125,11 +176,24 @@ class TestPyrochem(unittest.TestCase):
         self.assertIsInstance(out, pd.DataFrame)
         self.assertTrue(target in out.columns)
 
+    def test_pyrochem_aggregate_element_inplace(self):
+        obj = self.df.copy(deep=True)
+        expect = obj.pyrochem.aggregate_element("Fe")
+        obj.pyrochem.aggregate_element("Fe", inplace=True)
+        self.assertEqual(obj.columns.tolist(), expect.columns.tolist())
+        self.assertTrue(np.allclose(obj["Fe"], expect["Fe"]))
+
     def test_pyrochem_devolatilise(self):
         obj = self.df.copy(deep=True).pyrochem.compositional
         out = obj.pyrochem.devolatilise()
         self.assertNotIn("H2O", out.columns)
 
+    def test_pyrochem_devolatilise_inplace(self):
+        obj = self.df.copy(deep=True).pyrochem.compositional
+        obj.pyrochem.devolatilise(inplace=True)
+        self.assertNotIn("H2O", obj.columns)
+        self.assertNotIn("H2O", obj.pyrochem.list_oxides)
+
     def test_pyrochem_elemental_sum(self):
         obj = self.df.copy(deep=True)
         Mg = obj.pyrochem.elemental_sum("Mg")
@@ -165,6 +229,11 @@ class TestPyrochem(unittest.TestCase):
         obj = self.df.copy(deep=True).pyrochem.compositional
         out = obj.pyrochem.normalize_to(np.ones(obj.columns.size))
 
+    def test_pyrochem_normalize_to_float32(self):
+        obj = self.df.copy(deep=True).pyrochem.compositional.astype("float32")
+        out = obj.pyrochem.normalize_to("Chondrite_PON")
+        self.assertTrue((out.dtypes == np.float32).all())
+
     def test_pyrochem_denormalize_from_str(self):
         obj = self.df.copy(deep=True).pyrochem.compositional
         out = obj.pyrochem.denormalize_from("Chondrite_PON")
@@ -182,3 +251,28 @@ class TestPyrochem(unittest.TestCase):
         REEppm = obj.pyrochem.REE.pyrochem.scale("wt%", "ppm")
         self.assertFalse(np.isclose(REEppm.values, obj.pyrochem.REE.values).any())
         self.assertTrue((REEppm.values > obj.pyrochem.REE.values).all())
+
+    def test_pyrochem_scale_attrs(self):
+        obj = self.df.copy(deep=True).pyrochem.compositional
+        obj.attrs["inverts_to"] = obj.columns.tolist()
+        for df in [obj, obj.astype("object")]:
+            with self.subTest(dtypes=set(df.dtypes)):
+                out = df.pyrochem.scale("wt%", "ppm")
+                self.assertEqual(out.attrs, obj.attrs)
+
+    def test_pyrochem_series_scale(self):
+        ser = self.df.loc[0, self.df.pyrochem.list_REE]
+        REEppm = ser.pyrochem.scale("wt%", "ppm")
+        self.assertIsInstance(REEppm, pd.Series)
+        self.assertTrue((REEppm.values > ser.values).all())
+        self.assertFalse(hasattr(ser.pyrochem, "list_elements"))
+
+    def test_pyrochem_scale_mixed_dtypes(self):
+        obj = self.df.copy(deep=True).pyrochem.compositional
+        obj["MgO"] = obj["MgO"].astype("float32")
+        expect = obj.pyrochem.REE * 10000.0
+        for df in [obj, obj.pyrochem.REE]:
+            with self.subTest(dtypes=set(df.dtypes)):
+                out = df.pyrochem.scale("wt%", "ppm")
+                self.assertTrue((out.dtypes == df.dtypes).all())
+                self.assertTrue(np.allclose(out[expect.columns], expect))
@@ -25,6 +25,19 @@ class TestToMolecular(unittest.TestCase):
         ret = to_molecular(self.df)
         self.assertTrue((ret != self.df).all().all())
 
+    def test_single_component(self):
+        """Checks results for a single component, as a series or dataframe."""
+        expect = to_molecular(self.df, renorm=False)["MgO"]
+        for obj in [self.df["MgO"], self.df[["MgO"]]]:
+            with self.subTest(obj=type(obj)):
+                ret = to_molecular(obj, renorm=False)
+                self.assertIsInstance(ret, type(obj))
+                self.assertTrue(np.allclose(ret.values.ravel(), expect.values))
+        for name in [None, "", "foo"]:  # series need to be named by a component
+            with self.subTest(name=name):
+                with self.assertRaises(ValueError):
+                    to_molecular(pd.Series([1.0, 2.0], name=name))
+
 
 class TestToWeight(unittest.TestCase):
     """Tests pandas weight conversion operator."""
@@ -42,6 +55,19 @@ class TestToWeight(unittest.TestCase):
         ret = to_weight(self.df)
         self.assertTrue((ret != self.df).all().all())
 
+    def test_single_component(self):
+        """Checks results for a single component, as a series or dataframe."""
+        expect = to_weight(self.df, renorm=False)["MgO"]
+        for obj in [self.df["MgO"], self.df[["MgO"]]]:
+            with self.subTest(obj=type(obj)):
+                ret = to_weight(obj, renorm=False)
+                self.assertIsInstance(ret, type(obj))
+                self.assertTrue(np.allclose(ret.values.ravel(), expect.values))
+        for name in [None, "", "foo"]:  # series need to be named by a component
+            with self.subTest(name=name):
+                with self.assertRaises(ValueError):
+                    to_weight(pd.Series([1.0, 2.0], name=name))
+
 
 class TestWeightMolarReversal(unittest.TestCase):
     """Tests the reversability of weight-molar unit transformations."""
@@ -378,6 +404,32 @@ class TestGetRatio(unittest.TestCase):
                 r = get_ratio(df, ratio=ratio, norm_to=norm_to)
                 self.assertFalse(np.isclose(values, r.values).any())
 
+    def test_single_species_matches_aggregate(self):
+        """Check that ratios of components present as a single species match those
+        aggregated with elemental_sum, including for invalid values."""
+        df = self.df.copy()
+        df.loc[0, "Li"] = -1.0
+        df.loc[1, "B"] = 0.0
+        df.loc[2, "CaO"] = np.inf
+        for ratio in ["Li/B", "CaO/Si", "MgO/Si"]:
+            with self.subTest(ratio=ratio):
+                num, den = ratio.split("/")
+                expect = elemental_sum(df, num, to=num) / elemental_sum(df, den, to=den)
+                expect[~np.isfinite(expect)] = np.nan
+                r = get_ratio(df, ratio=ratio)
+                self.assertTrue(np.allclose(r, expect, equal_nan=True))
+
+    def test_total_suffix(self):
+        """Check that ratios of total components don't depend on which other
+        species of the cation are present."""
+        df = normal_frame(columns=["FeOT", "MgO", "SiO2"])
+        expect = df["FeOT"] / df["MgO"]
+        r = get_ratio(df, ratio="FeOT/MgO")
+        self.assertTrue(np.allclose(r, expect))
+        df["FeO"] = df["FeOT"] / 2.0  # now aggregated via elemental_sum
+        r = get_ratio(df, ratio="FeOT/MgO")
+        self.assertTrue(np.allclose(r, expect * 1.5))
+
     def test_alias(self):
         """Check that aliases can be used."""
         df = self.df.copy()
@@ -450,6 +502,18 @@ class TestLambdaLnREE(unittest.TestCase):
                 ret = lambda_lnREE(self.df, exclude=exclude, degree=self.default_degree)
                 self.assertTrue(ret.columns.size == self.default_degree)
 
+    def test_empty_columns_excluded(self):
+        """
+        Check that empty columns are excluded from the fit without being added to
+        the exclusion list for subsequent calls.
+        """
+        df = self.df.copy()
+        df["Tb"] = np.nan
+        exclude = ["Pm", "Eu"]
+        ret = lambda_lnREE(df, exclude=exclude, degree=self.default_degree)
+        self.assertTrue(np.isfinite(ret.values).all())
+        self.assertEqual(exclude, ["Pm", "Eu"])
+
     def test_degree(self):
         """
         Tests the ability to generate lambdas of different degree.
@@ -538,6 +602,18 @@ class TestConvertChemistry(unittest.TestCase):
         conv_df = convert_chemistry(self.df, to=out_components, renorm=False)
         self.assertTrue(all([a == b for a, b in zip(conv_df.columns, out_components)]))
 
+    def test_same_cation_components(self):
+        # components with the same cation each take the full elemental sum
+        df = self.df.copy()
+        df["Si"] = 0.1
+        conv_df = convert_chemistry(df, to=["Si", "SiO2", "MgO"], renorm=False)
+        self.assertEqual(conv_df.columns.tolist(), ["Si", "SiO2", "MgO"])
+        self.assertTrue(np.allclose(conv_df["Si"], elemental_sum(df, "Si")))
+        self.assertTrue(
+            np.allclose(conv_df["SiO2"], elemental_sum(df, "Si", to="SiO2"))
+        )
+        self.assertTrue(np.allclose(conv_df["MgO"], df["MgO"]))
+
     def test_iron_species_column_already_exists(self):
         self.df["Fe2O3"] = np.nan
         conv_df = convert_chemistry(self.df, to=["Fe2O3"])
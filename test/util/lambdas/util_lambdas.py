@@ -9,7 +9,7 @@ from pyrolite.geochem.ind import REE, get_ionic_radii
 from pyrolite.geochem.norm import get_reference_composition
 from pyrolite.util.lambdas import calc_lambdas
 from pyrolite.util.lambdas.eval import get_lambda_poly_function, lambda_poly
-from pyrolite.util.lambdas.params import orthogonal_polynomial_constants
+from pyrolite.util.lambdas.params import _get_params, orthogonal_polynomial_constants
 from pyrolite.util.synthetic import random_cov_matrix
 
 
@@ -100,6 +100,22 @@ class TestOPConstants(unittest.TestCase):
                         self.assertTrue(np.allclose(a, b, atol=test_tol))
 
 
+class TestGetParams(unittest.TestCase):
+    def test_named_params(self):
+        for params in ["full", "O'Neill (2016)"]:
+            with self.subTest(params=params):
+                first = _get_params(params, degree=4)
+                self.assertIsInstance(first, list)
+                self.assertEqual(len(first), 4)
+                first.append(())  # modifying the output shouldn't modify the cache
+                self.assertEqual(_get_params(params, degree=4), first[:-1])
+
+    def test_named_params_degree(self):
+        for degree in range(1, 5):
+            with self.subTest(degree=degree):
+                self.assertEqual(len(_get_params("full", degree=degree)), degree)
+
+
 class TestGetLambdaPolyFunc(unittest.TestCase):
     """Checks the generation of lambda polynomial functions."""
 
@@ -121,6 +137,14 @@ class TestGetLambdaPolyFunc(unittest.TestCase):
         ret = get_lambda_poly_function(self.lambdas, params=params)
         self.assertTrue(callable(ret))
 
+    def test_multiple_lambdas(self):
+        params = orthogonal_polynomial_constants(self.xs, degree=len(self.lambdas))
+        lambdas = np.vstack([self.lambdas, self.lambdas * 2])
+        ret = get_lambda_poly_function(lambdas, params=params)(self.xs)
+        self.assertEqual(ret.shape, (2, self.xs.size))
+        single = get_lambda_poly_function(self.lambdas, params=params)(self.xs)
+        self.assertTrue(np.allclose(ret, [single, single * 2]))
+
 
 class TestCalcLambdas(unittest.TestCase):
     def setUp(self):
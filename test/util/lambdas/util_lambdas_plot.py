@@ -5,6 +5,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
+import pyrolite.geochem
 from pyrolite.util.lambdas.plot import (
     plot_lambdas_components,
     plot_profiles,
@@ -20,6 +21,15 @@ class TestPlotLambdasComponents(unittest.TestCase):
         ax = plot_lambdas_components(self.lambdas)
         self.assertIsInstance(ax, matplotlib.axes.Axes)
 
+    def test_lambda_lnREE_row(self):
+        df = pd.DataFrame(
+            [np.linspace(10.0, 1.0, len(pyrolite.geochem.REE()))],
+            columns=pyrolite.geochem.REE(),
+        )
+        ls = df.pyrochem.lambda_lnREE(norm_to=None)
+        ax = plot_lambdas_components(ls.iloc[-1, :])
+        self.assertIsInstance(ax, matplotlib.axes.Axes)
+
     def tearDown(self):
         plt.close("all")
 
@@ -8,20 +8,21 @@ from pyrolite.util.text import *
 
 class TestRemovePrefix(unittest.TestCase):
     def test_prefix_present(self):
-        pass
+        self.assertEqual(remove_prefix("A_string", "A_"), "string")
 
     def test_prefix_notpresent(self):
-        #
-        # for prefix in ['A_A_', 'B_', 'C_']:
-        #    with
-
-        # self.assertFalse(s.startswith(prefix))
-        pass
+        for prefix in ["B_", "string", "_A"]:
+            with self.subTest(prefix=prefix):
+                self.assertEqual(remove_prefix("A_string", prefix), "A_string")
 
     def test_double_prefix(self):
         """Should just remove one prefix."""
+        self.assertEqual(remove_prefix("A_A_string", "A_"), "A_string")
 
-        pass
+    def test_special_characters(self):
+        """Prefixes aren't interpreted as regular expressions."""
+        self.assertEqual(remove_prefix("(a).string", "(a)."), "string")
+        self.assertEqual(remove_prefix("ab", "."), "ab")
 
 
 class TestNormaliseWhitespace(unittest.TestCase):